@@ -1,9 +1,14 @@
-import { describe, it, expect } from "vitest";
+import { describe, it, expect, beforeEach, afterEach } from "vitest";
+import * as os from "os";
+import * as path from "path";
+import * as fs from "fs";
 import {
   calls_per_tool,
   calls_in_range,
   recent_sessions,
   session_detail,
+  read_sessions,
+  read_tool_calls,
   ToolCallSummary,
   SessionSummary,
   ToolCallDetail,
@@ -267,4 +272,38 @@ describe("query_stats", () => {
       expect(session_detail(TOOL_CALLS, "nonexistent")).toEqual([]);
     });
   });
+
+  describe("read_sessions and read_tool_calls", () => {
+    let tmp_dir: string;
+
+    beforeEach(() => {
+      tmp_dir = fs.mkdtempSync(path.join(os.tmpdir(), "ariadne-query-stats-test-"));
+    });
+
+    afterEach(() => {
+      fs.rmSync(tmp_dir, { recursive: true, force: true });
+    });
+
+    it("reads every record and skips blank lines", () => {
+      const content =
+        TOOL_CALLS.slice(0, 2).map((c) => JSON.stringify(c)).join("\n\n") +
+        "\n" +
+        JSON.stringify(TOOL_CALLS[2]);
+      fs.writeFileSync(path.join(tmp_dir, "tool_calls.jsonl"), content);
+
+      expect(read_tool_calls(tmp_dir)).toEqual(TOOL_CALLS.slice(0, 3));
+    });
+
+    it("reads sessions terminated by a trailing newline", () => {
+      const content = SESSIONS.map((s) => JSON.stringify(s) + "\n").join("");
+      fs.writeFileSync(path.join(tmp_dir, "sessions.jsonl"), content);
+
+      expect(read_sessions(tmp_dir)).toEqual(SESSIONS);
+    });
+
+    it("returns empty array when the file is missing", () => {
+      expect(read_sessions(tmp_dir)).toEqual([]);
+      expect(read_tool_calls(tmp_dir)).toEqual([]);
+    });
+  });
 });
@@ -52,10 +52,17 @@ export interface ToolCallDetail {
 function read_jsonl<T>(file_path: string): T[] {
   try {
     const content = fs.readFileSync(file_path, "utf-8");
-    return content
-      .split("\n")
-      .filter(Boolean)
-      .map((line) => JSON.parse(line) as T);
+    const rows: T[] = [];
+    let start = 0;
+    while (start < content.length) {
+      const newline = content.indexOf("\n", start);
+      const end = newline === -1 ? content.length : newline;
+      if (end > start) {
+        rows.push(JSON.parse(content.slice(start, end)) as T);
+      }
+      start = end + 1;
+    }
+    return rows;
   } catch {
     return [];
   }